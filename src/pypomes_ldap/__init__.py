@@ -1,18 +1,34 @@
 from .ldap_pomes import (
-    LDAP_BASE_DN, LDAP_BIND_DN, LDAP_BIND_PWD,
-    LDAP_SERVER_URI, LDAP_TIMEOUT, LDAP_TRACE_FILEPATH, LDAP_TRACE_LEVEL,
-    ldap_init, ldap_bind, ldap_unbind, ldap_add_entry, ldap_search, ldap_delete_entry,
+    LDAPPomesError,
+    LDAP_BASE_DN, LDAP_BIND_DN, LDAP_BIND_PWD, LDAP_CLIENT_SCOPE,
+    LDAP_CACHE_SIZE, LDAP_CACHE_TTL, LDAP_NEG_CACHE_TTL,
+    LDAP_POOL_SIZE, LDAP_SERVER_URI, LDAP_TIMEOUT, LDAP_TRACE_FILEPATH, LDAP_TRACE_LEVEL,
+    ldap_init, ldap_bind, ldap_unbind, ldap_session, ldap_close_thread_client,
+    ldap_add_entry, ldap_add_entries, ldap_search, ldap_search_paged, ldap_search_invalidate,
+    ldap_delete_entry, ldap_delete_entries,
     ldap_add_value, ldap_set_value, ldap_get_value, ldap_get_value_list, ldap_get_values,
-    ldap_get_values_lists, ldap_change_pwd, ldap_modify_user, ldap_modify_entry,
+    ldap_get_values_lists, ldap_change_pwd, ldap_modify_user, ldap_modify_entry, ldap_modify_entries,
+    ldap_add_entry_async, ldap_add_entries_async, ldap_modify_entry_async, ldap_modify_entries_async,
+    ldap_delete_entry_async, ldap_delete_entries_async, ldap_modify_user_async, ldap_change_pwd_async,
+    ldap_search_async, ldap_add_value_async, ldap_set_value_async, ldap_get_value_async,
+    ldap_get_value_list_async, ldap_get_values_async, ldap_get_values_lists_async,
 )
 
 __all__ = [
     # ldap_pomes
-    "LDAP_BASE_DN", "LDAP_BIND_DN", "LDAP_BIND_PWD",
-    "LDAP_SERVER_URI", "LDAP_TIMEOUT", "LDAP_TRACE_FILEPATH", "LDAP_TRACE_LEVEL",
-    "ldap_init", "ldap_bind", "ldap_unbind", "ldap_add_entry", "ldap_search", "ldap_delete_entry",
+    "LDAPPomesError",
+    "LDAP_BASE_DN", "LDAP_BIND_DN", "LDAP_BIND_PWD", "LDAP_CLIENT_SCOPE",
+    "LDAP_CACHE_SIZE", "LDAP_CACHE_TTL", "LDAP_NEG_CACHE_TTL",
+    "LDAP_POOL_SIZE", "LDAP_SERVER_URI", "LDAP_TIMEOUT", "LDAP_TRACE_FILEPATH", "LDAP_TRACE_LEVEL",
+    "ldap_init", "ldap_bind", "ldap_unbind", "ldap_session", "ldap_close_thread_client",
+    "ldap_add_entry", "ldap_add_entries", "ldap_search", "ldap_search_paged", "ldap_search_invalidate",
+    "ldap_delete_entry", "ldap_delete_entries",
     "ldap_add_value", "ldap_set_value", "ldap_get_value", "ldap_get_value_list", "ldap_get_values",
-    "ldap_get_values_lists", "ldap_change_pwd", "ldap_modify_user", "ldap_modify_entry",
+    "ldap_get_values_lists", "ldap_change_pwd", "ldap_modify_user", "ldap_modify_entry", "ldap_modify_entries",
+    "ldap_add_entry_async", "ldap_add_entries_async", "ldap_modify_entry_async", "ldap_modify_entries_async",
+    "ldap_delete_entry_async", "ldap_delete_entries_async", "ldap_modify_user_async", "ldap_change_pwd_async",
+    "ldap_search_async", "ldap_add_value_async", "ldap_set_value_async", "ldap_get_value_async",
+    "ldap_get_value_list_async", "ldap_get_values_async", "ldap_get_values_lists_async",
 ]
 
 from importlib.metadata import version
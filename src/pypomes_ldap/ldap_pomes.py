@@ -1,8 +1,24 @@
+import asyncio
+import atexit
+import copy
+import functools
 import ldap
+import os
 import sys
+import threading
+import time
+import warnings
+import weakref
+from cachetools import TTLCache
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from ldap import LDAPError, modlist
+from ldap.controls.libldap import SimplePagedResultsControl
+from ldap.dn import explode_dn
+from ldap.filter import escape_filter_chars
 from ldap.ldapobject import LDAPObject
 from pathlib import Path
+from queue import Empty, Full, Queue
 from typing import Final, TextIO
 from pypomes_core import (
     APP_PREFIX, TEMP_FOLDER,
@@ -14,56 +30,214 @@ LDAP_BASE_DN: Final[str] = None if _val is None else _val.replace(":", "=")
 _val = env_get_str(f"{APP_PREFIX}_LDAP_BIND_DN")
 LDAP_BIND_DN:  Final[str] = None if _val is None else _val.replace(":", "=")
 LDAP_BIND_PWD:  Final[str] = env_get_str(f"{APP_PREFIX}_LDAP_BIND_PWD")
+LDAP_CLIENT_SCOPE:  Final[str] = env_get_str(f"{APP_PREFIX}_LDAP_CLIENT_SCOPE", "pool")
+LDAP_CACHE_SIZE:  Final[int] = env_get_int(f"{APP_PREFIX}_LDAP_CACHE_SIZE", 1024)
+LDAP_CACHE_TTL:  Final[int] = env_get_int(f"{APP_PREFIX}_LDAP_CACHE_TTL", 60)
+LDAP_NEG_CACHE_TTL:  Final[int] = env_get_int(f"{APP_PREFIX}_LDAP_NEG_CACHE_TTL", 5)
 LDAP_SERVER_URI:  Final[str] = env_get_str(f"{APP_PREFIX}_LDAP_SERVER_URI")
+LDAP_POOL_SIZE:  Final[int] = env_get_int(f"{APP_PREFIX}_LDAP_POOL_SIZE", 10)
 LDAP_TIMEOUT:  Final[int] = env_get_int(f"{APP_PREFIX}_LDAP_TIMEOUT", 30)
 LDAP_TRACE_FILEPATH:  Final[Path] = env_get_path(f"{APP_PREFIX}_LDAP_TRACE_FILEPATH",
                                                  TEMP_FOLDER / f"{APP_PREFIX}_ldap.log")
 LDAP_TRACE_LEVEL:  Final[int] = env_get_int(f"{APP_PREFIX}_LDAP_TRACE_LEVEL", 0)
 
+if LDAP_CLIENT_SCOPE not in ["pool", "thread"]:
+    raise ValueError(f"Invalid value for {APP_PREFIX}_LDAP_CLIENT_SCOPE: '{LDAP_CLIENT_SCOPE}' "
+                     f"(expected 'pool' or 'thread')")
+if LDAP_POOL_SIZE is None or LDAP_POOL_SIZE < 1:
+    raise ValueError(f"Invalid value for {APP_PREFIX}_LDAP_POOL_SIZE: '{LDAP_POOL_SIZE}' "
+                     f"(expected a positive integer)")
 
-def ldap_init(errors: list[str], server_uri: str = LDAP_SERVER_URI,
-              trace_filepath: Path = LDAP_TRACE_FILEPATH, trace_level: int = LDAP_TRACE_LEVEL) -> LDAPObject:
+# base DN for the user entries, and filter matching any entry
+_USERS_BASE_DN: Final[str] = None if LDAP_BASE_DN is None else f"cn=users,{LDAP_BASE_DN}"
+_DEFAULT_FILTER: Final[str] = "(objectClass=*)"
+
+# whether the connections to the LDAP server at LDAP_SERVER_URI are safe
+_IS_SECURE: Final[bool] = LDAP_SERVER_URI is not None and LDAP_SERVER_URI.startswith("ldaps:")
+
+# pool of bound LDAP client objects, along with the time they were last used
+# (this and the per-thread clients, the search caches and their lock are recreated in a forked child process)
+_LDAP_POOL: Queue[tuple[LDAPObject, float]] = Queue(maxsize=LDAP_POOL_SIZE)
+
+# bounds on the number of concurrent operations started by the asynchronous functions, per event loop
+_ASYNC_SEMS: Final[weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]] = \
+    weakref.WeakKeyDictionary()
+
+# errors indicating that the connection to the LDAP server is no longer usable
+_CONN_ERRORS: Final[tuple[type[LDAPError], ...]] = (ldap.SERVER_DOWN, ldap.CONNECT_ERROR,
+                                                    ldap.TIMEOUT, ldap.UNAVAILABLE)
+
+# per-thread bound LDAP client objects, used in place of the pool if LDAP_CLIENT_SCOPE is 'thread'
+_TLS: threading.local = threading.local()
+
+# cache of search results, keyed by the search parameters, holding the RDNs of their base DN along with them
+_SEARCH_CACHE: TTLCache = TTLCache(maxsize=max(LDAP_CACHE_SIZE, 1),
+                                   ttl=LDAP_CACHE_TTL)
+# cache of searches which found nothing, kept for a shorter time
+_NEG_CACHE: TTLCache = TTLCache(maxsize=max(2 * LDAP_CACHE_SIZE, 1),
+                                ttl=LDAP_NEG_CACHE_TTL)
+_SEARCH_LOCK: threading.Lock = threading.Lock()
+# generation of the search caches, advanced on every invalidation
+_SEARCH_GEN: int = 0
+
+# LDAP client objects initialized in this process
+_LDAP_CLIENTS: Final[weakref.WeakSet[LDAPObject]] = weakref.WeakSet()
+
+# caller-owned LDAP client objects found to be no longer usable, while in use by an operation
+_FAILED_CLIENTS: Final[weakref.WeakSet[LDAPObject]] = weakref.WeakSet()
+
+# LDAP client objects inherited from the parent process, held so as to never be unbound,
+# as their connections are still in use by the parent
+_FORKED_CLIENTS: Final[list[LDAPObject]] = []
+
+# options applied to every LDAP client object
+_LDAP_OPTIONS: Final[tuple[tuple[int, int], ...]] = ((ldap.OPT_PROTOCOL_VERSION, 3),
+                                                     (ldap.OPT_REFERRALS, 0),
+                                                     (ldap.OPT_TIMEOUT, LDAP_TIMEOUT))
+
+# trace log files opened, to be closed on interpreter shutdown
+_TRACE_FILES: Final[weakref.WeakSet[TextIO]] = weakref.WeakSet()
+
+# trace log output devices standing for the standard streams
+_STD_TRACE_OUTS: Final[dict[str, TextIO]] = {
+    "sys.stdout": sys.stdout,
+    "sys.stderr": sys.stderr
+}
+
+
+def __open_trace_out(trace_filepath: Path | str | None) -> TextIO:
+
+    # retrieve/open the trace log output device
+    if trace_filepath is None:
+        result: TextIO | None = sys.stdout
+    else:
+        result: TextIO | None = _STD_TRACE_OUTS.get(str(trace_filepath))
+    if result is None:
+        result = Path.open(trace_filepath, "a")
+        _TRACE_FILES.add(result)
+
+    return result
+
+
+def __close_trace_files() -> None:
+
+    for trace_file in list(_TRACE_FILES):
+        trace_file.close()
+
+
+atexit.register(__close_trace_files)
+
+# trace log output device for LDAP_TRACE_FILEPATH, shared by the LDAP client objects
+try:
+    _out: TextIO = __open_trace_out(LDAP_TRACE_FILEPATH)
+except OSError:
+    _out = sys.stderr
+_DEFAULT_TRACE_OUT: Final[TextIO] = _out
+
+
+def __reset_after_fork() -> None:
+
+    global _LDAP_POOL, _TLS, _SEARCH_CACHE, _NEG_CACHE, _SEARCH_LOCK
+
+    # the inherited clients share their connections with the parent process, so they must not be used
+    # nor unbound (a client unbinds itself when garbage-collected)
+    _FORKED_CLIENTS.extend(_LDAP_CLIENTS)
+    _LDAP_CLIENTS.clear()
+
+    # recreate the shared state, as its locks may have been inherited while held by other threads
+    _LDAP_POOL = Queue(maxsize=LDAP_POOL_SIZE)
+    _TLS = threading.local()
+    _SEARCH_CACHE = TTLCache(maxsize=max(LDAP_CACHE_SIZE, 1),
+                             ttl=LDAP_CACHE_TTL)
+    _NEG_CACHE = TTLCache(maxsize=max(2 * LDAP_CACHE_SIZE, 1),
+                          ttl=LDAP_NEG_CACHE_TTL)
+    _SEARCH_LOCK = threading.Lock()
+
+
+os.register_at_fork(after_in_child=__reset_after_fork)
+
+
+class LDAPPomesError(Exception):
+    """
+    Error raised by the LDAP operations, carrying its error messages as *args*.
+
+    The operations raise it if their *errors* argument is *None*. Otherwise, its error messages
+    are appended to *errors*, and the operation returns *None*.
+    """
+
+
+def _legacy_errors(func: Callable = None, *, on_error: any = None) -> Callable:
+    """
+    Decorate an LDAP operation, so that the *LDAPPomesError* it raises are reported in its *errors* argument.
+
+    The error is raised as is, if *errors* is *None*. Otherwise, the operation returns *on_error*.
+    The decorator may be applied as is, or as *@_legacy_errors(on_error=...)*.
+
+    :param func: the LDAP operation, having *errors* as its first parameter
+    :param on_error: the value returned by the operation, if its error is reported in *errors*
+    :return: the decorated LDAP operation
+    """
+    # were only the decorator's arguments provided ?
+    if func is None:
+        # yes, decorate the operation with them
+        return functools.partial(_legacy_errors,
+                                 on_error=on_error)
+
+    @functools.wraps(func)
+    def wrapper(errors: list[str] | None, *args: any, **kwargs: any) -> any:
+        try:
+            return func(errors, *args, **kwargs)
+        except LDAPPomesError as e:
+            if errors is None:
+                raise
+            errors.extend(e.args)
+            return on_error
+
+    return wrapper
+
+
+@_legacy_errors
+def ldap_init(errors: list[str] | None, server_uri: str = LDAP_SERVER_URI,
+              trace_filepath: Path | None = None, trace_level: int = LDAP_TRACE_LEVEL,
+              trace_out: TextIO = _DEFAULT_TRACE_OUT) -> LDAPObject:
     """
     Initialize and return the LDAP client object.
 
     :param errors: incidental error messages
     :param server_uri: URI to access the LDAP server
-    :param trace_filepath: path for the trace log file
+    :param trace_filepath: deprecated, use *trace_out* instead
     :param trace_level: level for the trace log
+    :param trace_out: output device for the trace log
     :return: the LDAP client object
     """
-    # initialize the return variable
-    result: LDAPObject | None = None
-
     try:
-        # retrieve/open the trace log  output device
-        trace_out: TextIO
-        match trace_filepath:
-            case "sys.stdout" | None:
-                trace_out = sys.stdout
-            case "sys.stderr":
-                trace_out = sys.stderr
-            case _:
-                trace_out = Path.open(trace_filepath, "a")
+        # was the deprecated trace log file path provided ?
+        if trace_filepath is not None:
+            # yes, open its output device
+            warnings.warn(message="'trace_filepath' is deprecated, use 'trace_out' instead",
+                          category=DeprecationWarning,
+                          stacklevel=3)
+            trace_out = __open_trace_out(trace_filepath)
 
         if not isinstance(trace_level, int):
             trace_level = 0
 
         # obtem a conexão
-        result = ldap.initialize(uri=server_uri,
-                                 trace_level=trace_level,
-                                 trace_file=trace_out)
+        result: LDAPObject = ldap.initialize(uri=server_uri,
+                                             trace_level=trace_level,
+                                             trace_file=trace_out)
         # configura a conexão
-        result.set_option(ldap.OPT_PROTOCOL_VERSION, 3)
-        result.set_option(ldap.OPT_REFERRALS, 0)
-        result.set_option(ldap.OPT_TIMEOUT, LDAP_TIMEOUT)
+        for option, value in _LDAP_OPTIONS:
+            result.set_option(option, value)
+        _LDAP_CLIENTS.add(result)
     except Exception as e:
-        errors.append(f"Error initializing the LDAP client: {__ldap_except_msg(e)}")
+        raise LDAPPomesError(f"Error initializing the LDAP client: {__ldap_except_msg(e)}") from e
 
     return result
 
 
-def ldap_bind(errors: list[str], ldap_client: LDAPObject,
+@_legacy_errors(on_error=False)
+def ldap_bind(errors: list[str] | None, ldap_client: LDAPObject,
               bind_dn: str = LDAP_BIND_DN, bind_pwd: str = LDAP_BIND_PWD) -> bool:
     """
     Bind the given LDAP client object *conn* with the LDAP server, using the *DN* credentials *bind_dn*.
@@ -72,23 +246,20 @@ def ldap_bind(errors: list[str], ldap_client: LDAPObject,
     :param ldap_client: the LDAP client object
     :param bind_dn: DN credentials for the bind operation
     :param bind_pwd: password for the bind operation
-    :return: True if the bind operation ewas successful, False otherwise
+    :return: True if the bind operation was successful, False otherwise
     """
-    # initialize the return variable
-    result: bool = False
-
     # perform the bind
     try:
         ldap_client.simple_bind_s(who=bind_dn,
                                   cred=bind_pwd)
-        result = True
     except Exception as e:
-        errors.append(f"Error binding with the LDAP server: {__ldap_except_msg(e)}")
+        raise LDAPPomesError(f"Error binding with the LDAP server: {__ldap_except_msg(e)}") from e
 
-    return result
+    return True
 
 
-def ldap_unbind(errors: list[str], ldap_client: LDAPObject) -> None:
+@_legacy_errors
+def ldap_unbind(errors: list[str] | None, ldap_client: LDAPObject) -> None:
     """
     Unbind the given LDAP client object *conn* with the LDAP server.
 
@@ -97,155 +268,348 @@ def ldap_unbind(errors: list[str], ldap_client: LDAPObject) -> None:
     """
     try:
         ldap_client.unbind_s()
-        # is the log device 'stdout' ou 'stderr' ?
+        # is the log device 'stdout', 'stderr', or the shared one ?
         # noinspection PyProtectedMember
-        if ldap_client._trace_file.name not in ["<stdout>", "<stderr>"]: # noqa SLF001
+        if (ldap_client._trace_file.name not in ["<stdout>", "<stderr>"] and  # noqa SLF001
+                ldap_client._trace_file is not _DEFAULT_TRACE_OUT):  # noqa SLF001
             # no, close the log device
             # noinspection PyProtectedMember
             ldap_client._trace_file.close() # noqa SLF001
     except Exception as e:
-        errors.append(f"Error unbinding with the LDAP server: {__ldap_except_msg(e)}")
+        raise LDAPPomesError(f"Error unbinding with the LDAP server: {__ldap_except_msg(e)}") from e
+
+
+@contextmanager
+def _acquire_client(ldap_client: LDAPObject | None = None) -> Iterator[LDAPObject]:
+    """
+    Obtain a bound LDAP client object, for the duration of the *with* block.
+
+    If *ldap_client* is provided, it is yielded as is, and remains the caller's responsibility
+    (it is only flagged, if the error raised in the block indicates that it is no longer usable).
+    Otherwise, the client is taken from the pool, or, if *LDAP_CLIENT_SCOPE* is *thread*, it is the one
+    held by the current thread. A new client is initialized and bound if none is available, and a client
+    idle for longer than *LDAP_TIMEOUT* seconds has its liveness asserted before being handed out. On exit,
+    the client is released, unless the error raised in the block indicates that it is no longer usable,
+    in which case it is discarded.
+
+    :param ldap_client: optional bound LDAP client object, owned by the caller
+    :return: the bound LDAP client object
+    :raises LDAPPomesError: if a bound client could not be obtained
+    """
+    # was the LDAP client object provided ?
+    if ldap_client is not None:
+        # yes, use it, flagging it if the error raised in the block indicates that it is no longer usable
+        try:
+            yield ldap_client
+        except BaseException as e:
+            if __is_conn_failure(e):
+                _FAILED_CLIENTS.add(ldap_client)
+            raise
+        return
 
+    # obtain a client object
+    ldap_client = __checkout_client()
 
-def ldap_add_entry(errors: list[str], entry_dn: str, attrs: dict) -> None:
+    try:
+        yield ldap_client
+    except BaseException as e:
+        __checkin_client(ldap_client, failed=__is_conn_failure(e))
+        raise
+
+    # release the client
+    __checkin_client(ldap_client, failed=False)
+
+
+def ldap_close_thread_client() -> None:
+    """
+    Unbind and discard the LDAP client object held by the current thread, if any.
+
+    This applies if *LDAP_CLIENT_SCOPE* is *thread*, and is meant for the teardown of long-running workers.
+    The client object is otherwise unbound when its thread is garbage-collected.
+    """
+    ldap_client: LDAPObject | None = getattr(_TLS, "client", None)
+    if ldap_client is not None:
+        _TLS.client = None
+        _TLS.depth = 0
+        _TLS.finalizer.detach()
+        __discard_client(ldap_client)
+
+
+@contextmanager
+def ldap_session(errors: list[str] | None) -> Iterator[LDAPObject | None]:
+    """
+    Obtain a bound LDAP client object, to be passed to a batch of operations in the *with* block.
+
+    The client object is obtained as in every operation (see *LDAP_CLIENT_SCOPE*), and released
+    at the end of the block, unless an operation found it to be no longer usable, in which case it is discarded.
+    *None* is yielded if a bound client could not be obtained, and *errors* is provided.
+
+    :param errors: incidental error messages
+    :return: the bound LDAP client object, or None if it could not be obtained
+    """
+    # obtain a client object
+    ldap_client: LDAPObject | None = None
+    try:
+        ldap_client = __checkout_client()
+    except LDAPPomesError as e:
+        if errors is None:
+            raise
+        errors.extend(e.args)
+
+    try:
+        yield ldap_client
+    except BaseException as e:
+        __checkin_client(ldap_client, failed=__is_conn_failure(e))
+        raise
+
+    # release the client, discarding it if it was found to be no longer usable while in use
+    __checkin_client(ldap_client, failed=ldap_client is not None and ldap_client in _FAILED_CLIENTS)
+
+
+@_legacy_errors
+def ldap_add_entry(errors: list[str] | None, entry_dn: str, attrs: dict,
+                   ldap_client: LDAPObject | None = None) -> None:
     """
     Add an entry to the LDAP store.
 
     :param errors: incidental error messages
     :param entry_dn: the entry DN
     :param attrs: the entry attributes
+    :param ldap_client: optional bound LDAP client object (a pooled one is used, if not provided)
     """
-    # obtain the LDAP client object
-    ldap_client: LDAPObject = ldap_init(errors)
-
-    bound: bool = False
-    # was the LDAP client object obtained ?
-    if ldap_client:
-        # yes, bind it with the LDAP server
-        bound = ldap_bind(errors, ldap_client)
-
-    # were there errors ?
-    if not errors:
-        # no, proceed
+    # obtain a bound LDAP client object
+    with _acquire_client(ldap_client) as conn:
         ldiff: list[tuple[any, any]] = modlist.addModlist(attrs)
         try:
-            ldap_client.add_s(dn=entry_dn,
-                              modlist=ldiff)
+            conn.add_s(dn=entry_dn,
+                       modlist=ldiff)
         except Exception as e:
-            errors.append(f"Error on the LDAP add entry operation: {__ldap_except_msg(e)}")
+            raise LDAPPomesError(f"Error on the LDAP add entry operation: {__ldap_except_msg(e)}") from e
+        finally:
+            # the cached search results may no longer be valid, even if the operation failed,
+            # as it may still have been performed by the LDAP server
+            ldap_search_invalidate(entry_dn)
 
-    # unbind the LDAP client, if applicable
-    if bound:
-        ldap_unbind(errors, ldap_client)
 
+@_legacy_errors
+def ldap_add_entries(errors: list[str] | None, entries: list[tuple[str, dict]],
+                     ldap_client: LDAPObject | None = None) -> None:
+    """
+    Add entries to the LDAP store.
+
+    The add requests are all sent before their results are collected, on the same connection.
 
-def ldap_modify_entry(errors: list[str], entry_dn: str, mod_entry: list[tuple[int, str, any]]) -> None:
+    :param errors: incidental error messages
+    :param entries: the DNs and attributes of the entries
+    :param ldap_client: optional bound LDAP client object (a pooled one is used, if not provided)
+    """
+    try:
+        # obtain a bound LDAP client object
+        with _acquire_client(ldap_client) as conn:
+            # send the add requests
+            err_msgs: list[str] = []
+            excs: list[Exception] = []
+            msgids: list[tuple[str, int]] = []
+            for entry_dn, attrs in entries:
+                ldiff: list[tuple[any, any]] = modlist.addModlist(attrs)
+                try:
+                    msgids.append((entry_dn, conn.add(dn=entry_dn,
+                                                      modlist=ldiff)))
+                except Exception as e:
+                    err_msgs.append(f"Error on the LDAP add entry operation: {__ldap_except_msg(e)}")
+                    excs.append(e)
+
+            # collect the results
+            __collect_results(conn, "add entry", msgids, err_msgs, excs)
+            if err_msgs:
+                raise LDAPPomesError(*err_msgs) from __batch_cause(excs)
+    finally:
+        # the cached search results may no longer be valid
+        ldap_search_invalidate(*(entry_dn for entry_dn, _ in entries))
+
+
+@_legacy_errors
+def ldap_modify_entry(errors: list[str] | None, entry_dn: str, mod_entry: list[tuple[int, str, any]],
+                      ldap_client: LDAPObject | None = None) -> None:
     """
     Add an entry to the LDAP store.
 
     :param errors: incidental error messages
     :param entry_dn: the entry DN
     :param mod_entry: the list of modified entry attributes
+    :param ldap_client: optional bound LDAP client object (a pooled one is used, if not provided)
     """
-    # obtain the LDAP client object
-    conn: LDAPObject = ldap_init(errors)
-
-    bound: bool = False
-    # was the LDAP client object obtained ?
-    if conn:
-        # yes, bind it with the LDAP server
-        bound = ldap_bind(errors, conn)
-
-    # were there errors ?
-    if not errors:
-        # no, proceed
+    # obtain a bound LDAP client object
+    with _acquire_client(ldap_client) as conn:
         try:
             conn.modify_s(dn=entry_dn,
                           modlist=mod_entry)
         except Exception as e:
-            errors.append(f"Error on the LDAP modify entry operation: {__ldap_except_msg(e)}")
-
-    # unbind the LDAP client, if applicable
-    if bound:
-        ldap_unbind(errors, conn)
+            raise LDAPPomesError(f"Error on the LDAP modify entry operation: {__ldap_except_msg(e)}") from e
+        finally:
+            # the cached search results may no longer be valid, even if the operation failed,
+            # as it may still have been performed by the LDAP server
+            ldap_search_invalidate(entry_dn)
 
 
-def ldap_delete_entry(errors: list[str], entry_dn: str) -> None:
+@_legacy_errors
+def ldap_delete_entry(errors: list[str] | None, entry_dn: str, ldap_client: LDAPObject | None = None) -> None:
     """
     Remove an entry to the LDAP store.
 
     :param errors: incidental error messages
     :param entry_dn: the entry DN
+    :param ldap_client: optional bound LDAP client object (a pooled one is used, if not provided)
     """
-    # obtain the LDAP client object
-    conn: LDAPObject = ldap_init(errors)
-
-    bound: bool = False
-    # was the LDAP client object obtained ?
-    if conn:
-        # yes, bind it with the LDAP server
-        bound = ldap_bind(errors, conn)
-
-    # were there errors ?
-    if not errors:
-        # no, proceed
+    # obtain a bound LDAP client object
+    with _acquire_client(ldap_client) as conn:
         try:
             conn.delete_s(dn=entry_dn)
         except Exception as e:
-            errors.append(f"Error on the LDAP delete entry operation: {__ldap_except_msg(e)}")
+            raise LDAPPomesError(f"Error on the LDAP delete entry operation: {__ldap_except_msg(e)}") from e
+        finally:
+            # the cached search results may no longer be valid, even if the operation failed,
+            # as it may still have been performed by the LDAP server
+            ldap_search_invalidate(entry_dn)
 
-    # unbind the LDAP client, if applicable
-    if bound:
-        ldap_unbind(errors, conn)
 
+@_legacy_errors
+def ldap_modify_entries(errors: list[str] | None, entries: list[tuple[str, list[tuple[int, str, any]]]],
+                        ldap_client: LDAPObject | None = None) -> None:
+    """
+    Modify entries at the LDAP store.
+
+    The modify requests are all sent before their results are collected, on the same connection.
 
-def ldap_modify_user(errors: list[str], user_id: str, attrs: list[tuple[str, bytes | None]]) -> None:
+    :param errors: incidental error messages
+    :param entries: the DNs and lists of modified attributes of the entries
+    :param ldap_client: optional bound LDAP client object (a pooled one is used, if not provided)
+    """
+    try:
+        # obtain a bound LDAP client object
+        with _acquire_client(ldap_client) as conn:
+            # send the modify requests
+            err_msgs: list[str] = []
+            excs: list[Exception] = []
+            msgids: list[tuple[str, int]] = []
+            for entry_dn, mod_entry in entries:
+                try:
+                    msgids.append((entry_dn, conn.modify(dn=entry_dn,
+                                                         modlist=mod_entry)))
+                except Exception as e:
+                    err_msgs.append(f"Error on the LDAP modify entry operation: {__ldap_except_msg(e)}")
+                    excs.append(e)
+
+            # collect the results
+            __collect_results(conn, "modify entry", msgids, err_msgs, excs)
+            if err_msgs:
+                raise LDAPPomesError(*err_msgs) from __batch_cause(excs)
+    finally:
+        # the cached search results may no longer be valid
+        ldap_search_invalidate(*(entry_dn for entry_dn, _ in entries))
+
+
+@_legacy_errors
+def ldap_delete_entries(errors: list[str] | None, entry_dns: list[str],
+                        ldap_client: LDAPObject | None = None) -> None:
+    """
+    Remove entries from the LDAP store.
+
+    The delete requests are all sent before their results are collected, on the same connection.
+
+    :param errors: incidental error messages
+    :param entry_dns: the DNs of the entries
+    :param ldap_client: optional bound LDAP client object (a pooled one is used, if not provided)
+    """
+    try:
+        # obtain a bound LDAP client object
+        with _acquire_client(ldap_client) as conn:
+            # send the delete requests
+            err_msgs: list[str] = []
+            excs: list[Exception] = []
+            msgids: list[tuple[str, int]] = []
+            for entry_dn in entry_dns:
+                try:
+                    msgids.append((entry_dn, conn.delete(dn=entry_dn)))
+                except Exception as e:
+                    err_msgs.append(f"Error on the LDAP delete entry operation: {__ldap_except_msg(e)}")
+                    excs.append(e)
+
+            # collect the results
+            __collect_results(conn, "delete entry", msgids, err_msgs, excs)
+            if err_msgs:
+                raise LDAPPomesError(*err_msgs) from __batch_cause(excs)
+    finally:
+        # the cached search results may no longer be valid
+        ldap_search_invalidate(*entry_dns)
+
+
+@_legacy_errors
+def ldap_modify_user(errors: list[str] | None, user_id: str, attrs: list[tuple[str, bytes | None]],
+                     ldap_client: LDAPObject | None = None) -> None:
     """
     Modify a user entry at the LDAP store.
 
     :param errors: incidental error messages
     :param user_id: id of the user
     :param attrs: the list of modified attributes
+    :param ldap_client: optional bound LDAP client object (a pooled one is used, if not provided)
     """
-    # invoke the search operation
-    search_data: list[tuple[str, dict]] = ldap_search(errors, f"cn=users,{LDAP_BASE_DN}",
-                                                      [attr[0] for attr in attrs],
-                                                      ldap.SCOPE_ONELEVEL, f"cn={user_id}")
-
-    # did the search operation returned data ?
-    if not search_data:  # search_data is None or len(search_data) == 0
+    # obtain a bound LDAP client object, to be used for both the search and the modify operations
+    with _acquire_client(ldap_client) as conn:
+        # invoke the search operation
+        try:
+            search_data: list[tuple[str, dict]] = conn.search_s(base=_USERS_BASE_DN,
+                                                                scope=ldap.SCOPE_ONELEVEL,
+                                                                filterstr=f"(cn={escape_filter_chars(user_id)})",
+                                                                attrlist=[attr[0] for attr in attrs])
+        except Exception as e:
+            raise LDAPPomesError(f"Error on the LDAP search operation: {__ldap_except_msg(e)}") from e
+
+        # did the search operation returned data ?
+        if search_data:
+            # yes, proceed
+            entry_dn: str = search_data[0][0]
+
+            # build the modification list, from the differences between the current and new values
+            # (the attributes are replaced or removed as a whole, as removing specific values
+            # requires an equality matching rule, which some attributes lack)
+            mod_entries: list[tuple[int, str, list[bytes] | None]] = []
+            for attr_name, new_value in attrs:
+                old_set: set[bytes] = set(search_data[0][1].get(attr_name) or ())
+                new_set: set[bytes] = {new_value} if new_value else set()
+                if old_set == new_set:
+                    pass
+                elif not new_set:
+                    mod_entries.append((ldap.MOD_DELETE, attr_name, None))
+                elif not old_set:
+                    mod_entries.append((ldap.MOD_ADD, attr_name, list(new_set)))
+                else:
+                    mod_entries.append((ldap.MOD_REPLACE, attr_name, list(new_set)))
+
+            # are there attributes to be modified ?
+            if len(mod_entries) > 0:
+                # yes, modify them on the same connection
+                try:
+                    conn.modify_s(dn=entry_dn,
+                                  modlist=mod_entries)
+                except Exception as e:
+                    raise LDAPPomesError(f"Error on the LDAP modify entry operation: "
+                                         f"{__ldap_except_msg(e)}") from e
+                finally:
+                    # the cached search results for the user may no longer be valid, even if the operation
+                    # failed, as it may still have been performed by the LDAP server
+                    ldap_search_invalidate(entry_dn)
+
+    # was the user found ?
+    if not search_data:
         # no, report the error
-        errors.append(f"Error on the LDAP modify user operation: User '{user_id}' not found")
-
-    # were there errors ?
-    if not errors:
-        # no, proceed
-        entry_dn: str = search_data[0][0]
-
-        # build the modification list
-        mod_entries: list[tuple[int, str, bytes | None]] = []
-        for attr_name, new_value in attrs:
-            entry_list: list[bytes] = search_data[0][1].get(attr_name)
-            if new_value:
-                curr_value: bytes = None if entry_list is None else entry_list[0]
-                # assert whether the old and new values are equal
-                if new_value != curr_value:
-                    # define the modification mode
-                    if curr_value is None:
-                        mode: int = ldap.MOD_ADD
-                    else:
-                        mode: int = ldap.MOD_REPLACE
-                    mod_entries.append((mode, attr_name, new_value))
-            elif entry_list:
-                mod_entries.append((ldap.MOD_DELETE, attr_name, None))
-
-        # are there attributes to be modified ?
-        if len(mod_entries) > 0:
-            # yes, modify them
-            ldap_modify_entry(errors, entry_dn, mod_entries)
-
-
-def ldap_change_pwd(errors: list[str], user_dn: str, new_pwd: str, curr_pwd: str | None = None) -> str:
+        raise LDAPPomesError(f"Error on the LDAP modify user operation: User '{user_id}' not found")
+
+
+@_legacy_errors
+def ldap_change_pwd(errors: list[str] | None, user_dn: str, new_pwd: str, curr_pwd: str | None = None,
+                    ldap_client: LDAPObject | None = None) -> str:
     """
     Modify a user password at the LDAP store.
 
@@ -253,53 +617,33 @@ def ldap_change_pwd(errors: list[str], user_dn: str, new_pwd: str, curr_pwd: str
     :param user_dn: the user's DN credentials
     :param new_pwd: the new password
     :param curr_pwd: optional current password
+    :param ldap_client: optional bound LDAP client object (ignored if *curr_pwd* is provided;
+                        its own server URI determines whether the connection is safe)
     """
-    # initialize the return variable
-    result: str | None = None
-
-    # obtain the LDAP client object
-    ldap_client: LDAPObject = ldap_init(errors)
-
-    bound: bool = False
-    # bind the LDAP client with the LDAP server, if obtained
-    if ldap_client:
-        # was the password provided ?
-        if curr_pwd:
-            # yes, perform the bind with the DN provided
-            bound = ldap_bind(errors, ldap_client, user_dn, curr_pwd)
-        else:
-            # no, perform the standard bind
-            bound = ldap_bind(errors, ldap_client)
-
-    # were there errors ?
-    if not errors:
-        # no, proceed
+    # was the current password provided ?
+    if curr_pwd:
+        # yes, the bind must be performed with the DN provided, so neither a pooled nor the given client can be used
+        user_client: LDAPObject = ldap_init(None)
         try:
-            # is the connection safe ?
-            if __is_secure(ldap_client):
-                # yes, use the directive 'passwd_s'
-                resp: tuple[None, bytes] = ldap_client.passwd_s(user=user_dn,
-                                                                oldpw=curr_pwd,
-                                                                newpw=new_pwd,
-                                                                extract_newpw=True)
-                result = resp[1].decode()
-            else:
-                # no, use the directive 'modify_s'
-                ldap_client.modify_s(dn=user_dn,
-                                     modlist=[(ldap.MOD_REPLACE, "userpassword", new_pwd.encode())])
-                result = new_pwd
-        except Exception as e:
-            errors.append(f"Error on the LDAP password change operation: {__ldap_except_msg(e)}")
-
-    # unbind the LDAP client, if applicable
-    if bound:
-        ldap_unbind(errors, ldap_client)
+            ldap_bind(None, user_client, user_dn, curr_pwd)
+            result: str = __change_pwd(user_client, user_dn, new_pwd, curr_pwd, _IS_SECURE)
+        finally:
+            __discard_client(user_client)
+    else:
+        # no, use the LDAP client object provided, or a pooled one, bound with the standard credentials
+        # (the client provided may have been initialized with a server URI other than LDAP_SERVER_URI)
+        is_secure: bool = _IS_SECURE if ldap_client is None else \
+            ldap_client.get_option(ldap.OPT_URI).startswith("ldaps:")
+        with _acquire_client(ldap_client) as conn:
+            result: str = __change_pwd(conn, user_dn, new_pwd, curr_pwd, is_secure)
 
     return result
 
 
-def ldap_search(errors: list[str], base_dn: str,  attrs: list[str],
-                scope: str = None, filter_str: str = None, attrs_only: bool = False) -> list[tuple[str, dict]]:
+@_legacy_errors
+def ldap_search(errors: list[str] | None, base_dn: str,  attrs: list[str],
+                scope: str = None, filter_str: str = None, attrs_only: bool = False,
+                ldap_client: LDAPObject | None = None) -> list[tuple[str, dict]]:
     """
     Perform a search operation on the LDAP store, and return its results.
 
@@ -309,57 +653,158 @@ def ldap_search(errors: list[str], base_dn: str,  attrs: list[str],
     :param scope: optional scope for the search operation
     :param filter_str: optional filter for the search operation
     :param attrs_only: whether to return the values of the attributes searched
+    :param ldap_client: optional bound LDAP client object (a pooled one, with cached results, is used if not provided)
     :return:
     """
-    # initialize the return variable
-    result:  list[tuple[str, dict]] | None = None
-
-    # obtain the LDAP client object
-    conn: LDAPObject = ldap_init(errors)
-
-    bound: bool = False
-    # was the LDAP client object obtained ?
-    if conn:
-        # yes, bind it with the LDAP server
-        bound = ldap_bind(errors, conn)
-
-    # were there errors ?
-    if not errors:
-        # no, proceed (if 'attrs_only' is specified, the values for the attributes are not returned)
+    # the search caches apply only to pooled clients, as a client provided may be bound with other credentials
+    cacheable: bool = ldap_client is None
+    key: tuple = (base_dn, tuple(attrs or ()), scope, filter_str, attrs_only)
+    gen: int = 0
+
+    # are the results for this search in the cache ?
+    if cacheable:
+        with _SEARCH_LOCK:
+            gen = _SEARCH_GEN
+            if key in _NEG_CACHE:
+                # yes, the search found nothing
+                return []
+            cached: tuple[tuple[str, ...], list[tuple[str, dict]]] | None = _SEARCH_CACHE.get(key)
+        if cached is not None:
+            # yes, return a copy of them
+            return copy.deepcopy(cached[1])
+
+    # obtain a bound LDAP client object
+    with _acquire_client(ldap_client) as conn:
+        # if 'attrs_only' is specified, the values for the attributes are not returned
         attr_vals: int = 1 if attrs_only else 0
         try:
             # perform the search operation
             result = conn.search_s(base=base_dn,
                                    scope=scope or ldap.SCOPE_BASE,
-                                   filterstr=filter_str or "(objectClass=*)",
+                                   filterstr=filter_str or _DEFAULT_FILTER,
                                    attrlist=attrs,
                                    attrsonly=attr_vals)
+        except ldap.NO_SUCH_OBJECT:
+            # the base DN does not exist
+            result = []
         except Exception as e:
-            errors.append(f"Error on the LDAP search operation: {__ldap_except_msg(e)}")
-
-    # unbind the LDAP client, if applicable
-    if bound:
-        ldap_unbind(errors, conn)
+            raise LDAPPomesError(f"Error on the LDAP search operation: {__ldap_except_msg(e)}") from e
+
+    # cache the results, if applicable, and if the caches were not invalidated during the search
+    if not cacheable or LDAP_CACHE_SIZE <= 0 or LDAP_CACHE_TTL <= 0:
+        pass
+    elif not result:
+        if LDAP_NEG_CACHE_TTL > 0:
+            base_rdns: tuple[str, ...] = __dn_rdns(base_dn)
+            with _SEARCH_LOCK:
+                if gen == _SEARCH_GEN:
+                    _NEG_CACHE[key] = (base_rdns, [])
+    else:
+        base_rdns: tuple[str, ...] = __dn_rdns(base_dn)
+        cached = (base_rdns, copy.deepcopy(result))
+        with _SEARCH_LOCK:
+            if gen == _SEARCH_GEN:
+                _SEARCH_CACHE[key] = cached
 
     return result
 
 
-def ldap_get_value(errors: list[str], entry_dn: str, attr: str) -> bytes:
+def ldap_search_paged(errors: list[str] | None, base_dn: str, attrs: list[str],
+                      scope: str = None, filter_str: str = None, page_size: int = 1000,
+                      ldap_client: LDAPObject | None = None) -> Iterator[tuple[str, dict]]:
+    """
+    Perform a search operation on the LDAP store, yielding its results as they are retrieved, page by page.
+
+    The whole iteration takes place on the same connection, and its results are not cached.
+
+    :param errors: incidental error messages
+    :param base_dn: the base DN
+    :param attrs: attributes to search for
+    :param scope: optional scope for the search operation (defaults to the whole subtree)
+    :param filter_str: optional filter for the search operation
+    :param page_size: maximum number of entries retrieved per page
+    :param ldap_client: optional bound LDAP client object (a pooled one is used, if not provided)
+    :return: the DN and attributes of the entries found
+    """
+    try:
+        # obtain a bound LDAP client object
+        with _acquire_client(ldap_client) as conn:
+            page_ctrl: SimplePagedResultsControl = SimplePagedResultsControl(criticality=True,
+                                                                             size=page_size,
+                                                                             cookie="")
+            cookie: bytes | None = None
+            while cookie is None or cookie:
+                try:
+                    # retrieve the next page
+                    msgid: int = conn.search_ext(base=base_dn,
+                                                 scope=scope or ldap.SCOPE_SUBTREE,
+                                                 filterstr=filter_str or _DEFAULT_FILTER,
+                                                 attrlist=attrs,
+                                                 serverctrls=[page_ctrl])
+                    _, page_data, _, resp_ctrls = conn.result3(msgid=msgid,
+                                                               timeout=LDAP_TIMEOUT)
+                except Exception as e:
+                    raise LDAPPomesError(f"Error on the LDAP search operation: {__ldap_except_msg(e)}") from e
+
+                yield from page_data
+
+                # obtain the cookie for the next page (it is empty after the last page)
+                cookie = next((ctrl.cookie for ctrl in resp_ctrls
+                               if ctrl.controlType == SimplePagedResultsControl.controlType), b"")
+                page_ctrl.cookie = cookie
+    except LDAPPomesError as e:
+        if errors is None:
+            raise
+        errors.extend(e.args)
+
+
+def ldap_search_invalidate(*entry_dns: str) -> None:
+    """
+    Remove from the search caches the results which might have been affected by a change to *entry_dns*.
+
+    These are the results, empty or not, of the searches whose base DN is one of *entry_dns*,
+    or one of their ancestors. Searches in progress are prevented from caching their results.
+
+    :param entry_dns: the DNs of the changed entries
+    """
+    global _SEARCH_GEN
+
+    # collect the RDNs of the changed entries and of their ancestors
+    affected: set[tuple[str, ...]] = set()
+    for entry_dn in entry_dns:
+        entry_rdns: tuple[str, ...] = __dn_rdns(entry_dn)
+        affected.update(entry_rdns[pos:] for pos in range(len(entry_rdns) + 1))
+
+    with _SEARCH_LOCK:
+        _SEARCH_GEN += 1
+        for cache in (_SEARCH_CACHE, _NEG_CACHE):
+            for key in list(cache.keys()):
+                cached: tuple[tuple[str, ...], list] | None = cache.get(key)
+                if cached is not None and cached[0] in affected:
+                    cache.pop(key, None)
+
+
+@_legacy_errors
+def ldap_get_value(errors: list[str] | None, entry_dn: str, attr: str,
+                   ldap_client: LDAPObject | None = None) -> bytes:
     """
     Retrieve and return the value of an attribute at the LDAP store.
 
     :param errors: incidental error messages
     :param entry_dn: the DN entry
     :param attr: target attribute
+    :param ldap_client: optional bound LDAP client object (a pooled one is used, if not provided)
     :return: the target attribute's value
     """
-    data: list[bytes] = ldap_get_value_list(errors, entry_dn, attr)
-    result: bytes = data[0] if isinstance(data, list) and len(data) > 0 else None
+    data: list[bytes] = ldap_get_value_list(None, entry_dn, attr, ldap_client)
+    result: bytes = data[0] if data else None
 
     return result
 
 
-def ldap_add_value(errors: list[str], entry_dn: str, attr: str, value: bytes) -> None:
+@_legacy_errors
+def ldap_add_value(errors: list[str] | None, entry_dn: str, attr: str, value: bytes,
+                   ldap_client: LDAPObject | None = None) -> None:
     """
     Add a value to an attribute at the LDAP store.
 
@@ -367,13 +812,16 @@ def ldap_add_value(errors: list[str], entry_dn: str, attr: str, value: bytes) ->
     :param entry_dn: the DN entry
     :param attr: target attribute
     :param value: value to add to the target attribute
+    :param ldap_client: optional bound LDAP client object (a pooled one is used, if not provided)
     :return: the target attribute's value
     """
     mod_entries: list[tuple[int, str, bytes]] = [(ldap.MOD_ADD, attr, value)]
-    ldap_modify_entry(errors, entry_dn, mod_entries)
+    ldap_modify_entry(None, entry_dn, mod_entries, ldap_client)
 
 
-def ldap_set_value(errors: list[str], entry_dn: str, attr: str, value: bytes | None) -> None:
+@_legacy_errors
+def ldap_set_value(errors: list[str] | None, entry_dn: str, attr: str, value: bytes | None,
+                   ldap_client: LDAPObject | None = None) -> None:
     """
     Add a value to an attribute at the LDAP store.
 
@@ -381,14 +829,23 @@ def ldap_set_value(errors: list[str], entry_dn: str, attr: str, value: bytes | N
     :param entry_dn: the DN entry
     :param attr: target attribute
     :param value: value to add to the target attribute
+    :param ldap_client: optional bound LDAP client object (a pooled one is used, if not provided)
     :return: the target attribute's value
     """
-    # obtain the target attribute's current value
-    curr_value: bytes = ldap_get_value(errors, entry_dn, attr)
+    # obtain a bound LDAP client object, to be used for both the search and the modify operations
+    with _acquire_client(ldap_client) as conn:
+        # obtain the target attribute's current value
+        try:
+            search_data: list[tuple[str, dict]] = conn.search_s(base=entry_dn,
+                                                                scope=ldap.SCOPE_BASE,
+                                                                filterstr=_DEFAULT_FILTER,
+                                                                attrlist=[attr])
+        except Exception as e:
+            raise LDAPPomesError(f"Error on the LDAP search operation: {__ldap_except_msg(e)}") from e
 
-    # were there errors ?
-    if not errors:
-        # no, determine the modification mode
+        # determine the modification mode
+        curr_values: list[bytes] | None = search_data[0][1].get(attr) if search_data else None
+        curr_value: bytes | None = curr_values[0] if curr_values else None
         mode: int | None = None
         if curr_value is None:
             if value is not None:
@@ -400,28 +857,38 @@ def ldap_set_value(errors: list[str], entry_dn: str, attr: str, value: bytes | N
 
         # was the modification mode determined ?
         if mode is not None:
-            # yes, update the LDAP store
-            mod_entries: list[tuple[int, str, bytes]] = [(mode, attr, value)]
-            ldap_modify_entry(errors, entry_dn, mod_entries)
-
-
-def ldap_get_value_list(errors: list[str], entry_dn: str, attr: str) -> list[bytes]:
+            # yes, update the LDAP store on the same connection
+            try:
+                conn.modify_s(dn=entry_dn,
+                              modlist=[(mode, attr, value)])
+            except Exception as e:
+                raise LDAPPomesError(f"Error on the LDAP modify entry operation: {__ldap_except_msg(e)}") from e
+            finally:
+                # the cached search results may no longer be valid, even if the operation failed,
+                # as it may still have been performed by the LDAP server
+                ldap_search_invalidate(entry_dn)
+
+
+@_legacy_errors
+def ldap_get_value_list(errors: list[str] | None, entry_dn: str, attr: str,
+                        ldap_client: LDAPObject | None = None) -> list[bytes]:
     """
     Retrieve and return the list of values of attribute *attr* in the LDAP store.
 
     :param errors: incidental error messages
     :param entry_dn: the DN of the target entry
     :param attr: the target attribute
+    :param ldap_client: optional bound LDAP client object (a pooled one is used, if not provided)
     :return: the target attribute's list of values
     """
     # initialize the return variable
     result: list[bytes] | None = None
 
     # perform the search operation
-    search_data: list[tuple[str, dict]] = ldap_search(errors, entry_dn, [attr])
+    search_data: list[tuple[str, dict]] = ldap_search(None, entry_dn, [attr], ldap_client=ldap_client)
 
     # did the search operation return data ?
-    if isinstance(search_data, list) and len(search_data) > 0:
+    if search_data:
         # yes, proceed
         user_data: dict = search_data[0][1]
         result = user_data.get(attr)
@@ -429,59 +896,394 @@ def ldap_get_value_list(errors: list[str], entry_dn: str, attr: str) -> list[byt
     return result
 
 
-def ldap_get_values(errors: list[str], entry_dn: str, attrs: list[str]) -> tuple[bytes,...]:
+@_legacy_errors
+def ldap_get_values(errors: list[str] | None, entry_dn: str, attrs: list[str],
+                    ldap_client: LDAPObject | None = None) -> tuple[bytes,...]:
     """
     Retrieve and return the values of attributes *attrs* in the LDAP store.
 
     :param errors: incidental error messages
     :param entry_dn: the DN of the target entry
     :param attrs: the list of target attributes
+    :param ldap_client: optional bound LDAP client object (a pooled one is used, if not provided)
     :return: the values for the target attributes
     """
     # initialize the return variable
     result: tuple[bytes,...] | None = None
 
     # perform the search operation
-    search_data: tuple = ldap_get_values_lists(errors, entry_dn, attrs)
+    search_data: list[tuple[str, dict]] = ldap_search(None, entry_dn, attrs, ldap_client=ldap_client)
 
     # did the search operation return data ?
-    if isinstance(search_data, tuple):
-        # yes, proceed
-        search_items: list[bytes] = [item if item is None else item[0] for item in search_data]
-        result = tuple(search_items)
+    if search_data:
+        # yes, obtain the first value of each attribute, in a single pass
+        user_data_get: Callable[[str], list[bytes] | None] = search_data[0][1].get
+        result = tuple(values[0] if values else None for values in map(user_data_get, attrs))
 
     return result
 
 
-def ldap_get_values_lists(errors: list[str], entry_dn: str, attrs: list[str]) -> tuple[list[bytes],...]:
+@_legacy_errors
+def ldap_get_values_lists(errors: list[str] | None, entry_dn: str, attrs: list[str],
+                          ldap_client: LDAPObject | None = None) -> tuple[list[bytes],...]:
     """
     Retrieve and return the lists of values of attributes *attrs* in the LDAP store.
 
     :param errors: incidental error messages
     :param entry_dn: the DN of the target entry
     :param attrs: the list of target attributes
+    :param ldap_client: optional bound LDAP client object (a pooled one is used, if not provided)
     :return: the target attributes' lists of values
     """
     # initialize the return variable
     result: tuple[list[bytes],...] | None = None
 
     # perform the search operation
-    search_data: list[tuple[str, dict]] = ldap_search(errors, entry_dn, attrs)
+    search_data: list[tuple[str, dict]] = ldap_search(None, entry_dn, attrs, ldap_client=ldap_client)
 
     # did the search operation return data ?
-    if isinstance(search_data, list) and len(search_data) > 0:
+    if search_data:
         # yes, proceed
         user_data: dict = search_data[0][1]
-        items: list[list[bytes]] = [user_data.get(attr) for attr in attrs]
-        result = tuple(items)
+        result = tuple(map(user_data.get, attrs))
 
     return result
 
 
-def __is_secure(conn: LDAPObject) -> bool:
+# the asynchronous functions below run their synchronous counterparts in worker threads, so as not to block
+# the event loop - a bridge for asynchronous callers, as truly asynchronous operations would require a native
+# asynchronous LDAP client
+async def ldap_add_entry_async(errors: list[str] | None, entry_dn: str, attrs: dict,
+                               ldap_client: LDAPObject | None = None) -> None:
+    """
+    Asynchronous version of *ldap_add_entry()*, performed in a worker thread.
+
+    See *ldap_add_entry()* for the parameters.
+    """
+    await __run_async(ldap_add_entry, errors, entry_dn, attrs, ldap_client)
+
+
+async def ldap_add_entries_async(errors: list[str] | None, entries: list[tuple[str, dict]],
+                                 ldap_client: LDAPObject | None = None) -> None:
+    """
+    Asynchronous version of *ldap_add_entries()*, performed in a worker thread.
+
+    See *ldap_add_entries()* for the parameters.
+    """
+    await __run_async(ldap_add_entries, errors, entries, ldap_client)
+
+
+async def ldap_modify_entry_async(errors: list[str] | None, entry_dn: str, mod_entry: list[tuple[int, str, any]],
+                                  ldap_client: LDAPObject | None = None) -> None:
+    """
+    Asynchronous version of *ldap_modify_entry()*, performed in a worker thread.
+
+    See *ldap_modify_entry()* for the parameters.
+    """
+    await __run_async(ldap_modify_entry, errors, entry_dn, mod_entry, ldap_client)
+
+
+async def ldap_delete_entry_async(errors: list[str] | None, entry_dn: str,
+                                  ldap_client: LDAPObject | None = None) -> None:
+    """
+    Asynchronous version of *ldap_delete_entry()*, performed in a worker thread.
+
+    See *ldap_delete_entry()* for the parameters.
+    """
+    await __run_async(ldap_delete_entry, errors, entry_dn, ldap_client)
+
+
+async def ldap_modify_entries_async(errors: list[str] | None, entries: list[tuple[str, list[tuple[int, str, any]]]],
+                                    ldap_client: LDAPObject | None = None) -> None:
+    """
+    Asynchronous version of *ldap_modify_entries()*, performed in a worker thread.
+
+    See *ldap_modify_entries()* for the parameters.
+    """
+    await __run_async(ldap_modify_entries, errors, entries, ldap_client)
+
+
+async def ldap_delete_entries_async(errors: list[str] | None, entry_dns: list[str],
+                                    ldap_client: LDAPObject | None = None) -> None:
+    """
+    Asynchronous version of *ldap_delete_entries()*, performed in a worker thread.
+
+    See *ldap_delete_entries()* for the parameters.
+    """
+    await __run_async(ldap_delete_entries, errors, entry_dns, ldap_client)
+
+
+async def ldap_modify_user_async(errors: list[str] | None, user_id: str, attrs: list[tuple[str, bytes | None]],
+                                 ldap_client: LDAPObject | None = None) -> None:
+    """
+    Asynchronous version of *ldap_modify_user()*, performed in a worker thread.
+
+    See *ldap_modify_user()* for the parameters.
+    """
+    await __run_async(ldap_modify_user, errors, user_id, attrs, ldap_client)
+
+
+async def ldap_change_pwd_async(errors: list[str] | None, user_dn: str, new_pwd: str, curr_pwd: str | None = None,
+                                ldap_client: LDAPObject | None = None) -> str:
+    """
+    Asynchronous version of *ldap_change_pwd()*, performed in a worker thread.
+
+    See *ldap_change_pwd()* for the parameters and the return value.
+    """
+    return await __run_async(ldap_change_pwd, errors, user_dn, new_pwd, curr_pwd, ldap_client)
+
+
+async def ldap_search_async(errors: list[str] | None, base_dn: str,  attrs: list[str],
+                            scope: str = None, filter_str: str = None, attrs_only: bool = False,
+                            ldap_client: LDAPObject | None = None) -> list[tuple[str, dict]]:
+    """
+    Asynchronous version of *ldap_search()*, performed in a worker thread.
+
+    See *ldap_search()* for the parameters and the return value.
+    """
+    return await __run_async(ldap_search, errors, base_dn, attrs, scope, filter_str, attrs_only, ldap_client)
+
+
+async def ldap_get_value_async(errors: list[str] | None, entry_dn: str, attr: str,
+                               ldap_client: LDAPObject | None = None) -> bytes:
+    """
+    Asynchronous version of *ldap_get_value()*, performed in a worker thread.
+
+    See *ldap_get_value()* for the parameters and the return value.
+    """
+    return await __run_async(ldap_get_value, errors, entry_dn, attr, ldap_client)
+
+
+async def ldap_add_value_async(errors: list[str] | None, entry_dn: str, attr: str, value: bytes,
+                               ldap_client: LDAPObject | None = None) -> None:
+    """
+    Asynchronous version of *ldap_add_value()*, performed in a worker thread.
+
+    See *ldap_add_value()* for the parameters.
+    """
+    await __run_async(ldap_add_value, errors, entry_dn, attr, value, ldap_client)
+
+
+async def ldap_set_value_async(errors: list[str] | None, entry_dn: str, attr: str, value: bytes | None,
+                               ldap_client: LDAPObject | None = None) -> None:
+    """
+    Asynchronous version of *ldap_set_value()*, performed in a worker thread.
+
+    See *ldap_set_value()* for the parameters.
+    """
+    await __run_async(ldap_set_value, errors, entry_dn, attr, value, ldap_client)
+
+
+async def ldap_get_value_list_async(errors: list[str] | None, entry_dn: str, attr: str,
+                                    ldap_client: LDAPObject | None = None) -> list[bytes]:
+    """
+    Asynchronous version of *ldap_get_value_list()*, performed in a worker thread.
+
+    See *ldap_get_value_list()* for the parameters and the return value.
+    """
+    return await __run_async(ldap_get_value_list, errors, entry_dn, attr, ldap_client)
+
+
+async def ldap_get_values_async(errors: list[str] | None, entry_dn: str, attrs: list[str],
+                                ldap_client: LDAPObject | None = None) -> tuple[bytes,...]:
+    """
+    Asynchronous version of *ldap_get_values()*, performed in a worker thread.
+
+    See *ldap_get_values()* for the parameters and the return value.
+    """
+    return await __run_async(ldap_get_values, errors, entry_dn, attrs, ldap_client)
+
+
+async def ldap_get_values_lists_async(errors: list[str] | None, entry_dn: str, attrs: list[str],
+                                      ldap_client: LDAPObject | None = None) -> tuple[list[bytes],...]:
+    """
+    Asynchronous version of *ldap_get_values_lists()*, performed in a worker thread.
+
+    See *ldap_get_values_lists()* for the parameters and the return value.
+    """
+    return await __run_async(ldap_get_values_lists, errors, entry_dn, attrs, ldap_client)
+
+
+def __change_pwd(ldap_client: LDAPObject, user_dn: str, new_pwd: str,
+                 curr_pwd: str | None, is_secure: bool) -> str:
+
+    try:
+        # is the connection safe ?
+        if is_secure:
+            # yes, use the directive 'passwd_s'
+            resp: tuple[None, bytes] = ldap_client.passwd_s(user=user_dn,
+                                                            oldpw=curr_pwd,
+                                                            newpw=new_pwd,
+                                                            extract_newpw=True)
+            result: str = resp[1].decode()
+        else:
+            # no, use the directive 'modify_s'
+            ldap_client.modify_s(dn=user_dn,
+                                 modlist=[(ldap.MOD_REPLACE, "userpassword", new_pwd.encode())])
+            result: str = new_pwd
+    except Exception as e:
+        raise LDAPPomesError(f"Error on the LDAP password change operation: {__ldap_except_msg(e)}") from e
+    finally:
+        # the cached search results for the user may no longer be valid, even if the operation failed,
+        # as it may still have been performed by the LDAP server
+        ldap_search_invalidate(user_dn)
+
+    return result
+
+
+async def __run_async(func: Callable, *args: any) -> any:
+
+    # obtain the bound for the running event loop (a semaphore is tied to the loop it is first used in)
+    loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+    sem: asyncio.Semaphore | None = _ASYNC_SEMS.get(loop)
+    if sem is None:
+        sem = _ASYNC_SEMS.setdefault(loop, asyncio.Semaphore(LDAP_POOL_SIZE))
+
+    # run the blocking operation in a worker thread, bounding the number of concurrent operations
+    async with sem:
+        return await asyncio.to_thread(func, *args)
+
+
+def __checkout_client() -> LDAPObject:
+
+    # obtain the thread's or a pooled client object
+    ldap_client: LDAPObject | None = None
+    last_used: float = 0
+    if LDAP_CLIENT_SCOPE == "thread":
+        ldap_client = getattr(_TLS, "client", None)
+        # is the thread's client in use by an outer scope ?
+        if ldap_client is not None and _TLS.depth > 0:
+            # yes, share it
+            _TLS.depth += 1
+            return ldap_client
+        if ldap_client is not None:
+            last_used = _TLS.last_used
+    else:
+        try:
+            ldap_client, last_used = _LDAP_POOL.get_nowait()
+        except Empty:
+            pass
+
+    # has the client been idle for too long ?
+    if ldap_client is not None and time.monotonic() - last_used > LDAP_TIMEOUT:
+        # yes, make sure it is still alive
+        try:
+            ldap_client.whoami_s()
+        except LDAPError:
+            if LDAP_CLIENT_SCOPE == "thread":
+                ldap_close_thread_client()
+            else:
+                __discard_client(ldap_client)
+            ldap_client = None
+
+    # was a client obtained ?
+    if ldap_client is None:
+        # no, initialize and bind a new one
+        ldap_client = ldap_init(None)
+        try:
+            ldap_bind(None, ldap_client)
+        except LDAPPomesError:
+            __discard_client(ldap_client)
+            raise
+        # is the client to be held by the thread ?
+        if LDAP_CLIENT_SCOPE == "thread":
+            # yes, unbind it when the thread is gone
+            _TLS.client = ldap_client
+            _TLS.finalizer = weakref.finalize(threading.current_thread(), __discard_thread_client,
+                                              ldap_client, os.getpid())
+
+    # is the client held by the thread ?
+    if LDAP_CLIENT_SCOPE == "thread":
+        # yes, it is now in use by the outermost scope
+        _TLS.depth = 1
+        _TLS.failed = False
+
+    return ldap_client
+
+
+def __checkin_client(ldap_client: LDAPObject | None, failed: bool) -> None:
+
+    if ldap_client is None:
+        pass
+    elif LDAP_CLIENT_SCOPE == "thread":
+        # the client stays with the thread, unless it failed in any of the scopes using it,
+        # in which case it is closed once released by the outermost one
+        if getattr(_TLS, "client", None) is ldap_client:
+            _TLS.depth -= 1
+            _TLS.failed = _TLS.failed or failed
+            if _TLS.depth > 0:
+                pass
+            elif _TLS.failed:
+                ldap_close_thread_client()
+            else:
+                _TLS.last_used = time.monotonic()
+    elif failed:
+        __discard_client(ldap_client)
+    else:
+        # return the client to the pool, if there is room
+        try:
+            _LDAP_POOL.put_nowait((ldap_client, time.monotonic()))
+        except Full:
+            __discard_client(ldap_client)
+
+
+def __is_conn_failure(exc: BaseException) -> bool:
+
+    # errors reported by the LDAP server on the operation itself leave the connection usable
+    cause: BaseException | None = exc.__cause__ if isinstance(exc, LDAPPomesError) else exc
+    return cause is not None and (not isinstance(cause, LDAPError) or isinstance(cause, _CONN_ERRORS))
+
+
+def __collect_results(ldap_client: LDAPObject, op_name: str, msgids: list[tuple[str, int]],
+                      err_msgs: list[str], excs: list[Exception]) -> None:
+
+    # wait for the results of the requests sent, in order
+    for entry_dn, msgid in msgids:
+        try:
+            ldap_client.result(msgid=msgid,
+                               all=1,
+                               timeout=LDAP_TIMEOUT)
+        except Exception as e:
+            err_msgs.append(f"Error on the LDAP {op_name} operation for '{entry_dn}': {__ldap_except_msg(e)}")
+            excs.append(e)
+            # has the wait for the result timed out ?
+            if isinstance(e, ldap.TIMEOUT):
+                # yes, abandon the request, as it may still be pending on the connection
+                try:
+                    ldap_client.abandon(msgid)
+                except LDAPError:
+                    pass
+
+
+def __batch_cause(excs: list[Exception]) -> Exception | None:
+
+    # the cause of a batch's failure is the first error leaving its connection unusable, if any,
+    # so that the connection is discarded
+    return next((exc for exc in excs if __is_conn_failure(exc)), excs[-1] if excs else None)
+
+
+def __dn_rdns(dn: str) -> tuple[str, ...]:
+
+    # normalize the DN into its RDNs, for the purpose of comparing DNs
+    try:
+        rdns: list[str] = explode_dn(dn)
+    except LDAPError:
+        rdns = dn.split(",")
+
+    return tuple(rdn.strip().lower() for rdn in rdns)
+
+
+def __discard_client(ldap_client: LDAPObject) -> None:
+
+    # errors on unbinding a discarded client are of no interest
+    ldap_unbind([], ldap_client)
+
+
+def __discard_thread_client(ldap_client: LDAPObject, pid: int) -> None:
 
-    # noinspection PyProtectedMember
-    return conn._uri.startswith("ldaps:") # noqa SLF001
+    # a client inherited by a forked child process is not to be unbound by it
+    if os.getpid() == pid:
+        __discard_client(ldap_client)
 
 
 # constrói a mensagem de erro a partir da exceção produzida
@@ -489,8 +1291,8 @@ def __ldap_except_msg(exc: Exception) -> str:
 
     if isinstance(exc, LDAPError):
         err_data: any = exc.args[0]
-        # type(exc) -> <class '<nome-da-classe'>
-        cls: str = f"{type(exc)}"[8:-2]
+        # same as the class name within "<class '...'>"
+        cls: str = f"{type(exc).__module__}.{type(exc).__qualname__}"
         result: str = f"'Type: {cls}; Code: {err_data.get('result')}; Msg: {err_data.get('desc')}'"
         info: str = err_data.get("info")
         if info: